@@ -1,4 +1,3 @@
-import datetime
 import logging
 import os
 import re
@@ -27,7 +26,7 @@ def save(
         )
         save_file_path += "/{}_{}.snap".format(
             os.path.splitext(os.path.basename(req_file_path))[0],
-            datetime.datetime.fromtimestamp(time.time()).strftime("%Y%m%d_%H%M%S"),
+            time.strftime("%Y%m%d_%H%M%S"),
         )
 
     labels = []
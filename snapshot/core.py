@@ -46,49 +46,74 @@ class _BackgroundWorkers:
         self._workers = {}
         self._explicitly_suspended = {}
         self._count = 0
+        # Saving calls suspend() and resume() from its own thread, the GUI
+        # thread may do so at the same time. The lock only guards the
+        # bookkeeping: suspending a worker waits for its current task, so the
+        # workers are called after the lock is released.
+        self._lock = Lock()
 
     def is_suspended(self):
         return self._count > 0
 
     def suspend_one(self, worker_name):
-        if not self._explicitly_suspended[worker_name]:
+        with self._lock:
+            if self._explicitly_suspended[worker_name]:
+                return
             self._explicitly_suspended[worker_name] = True
-            if not self.is_suspended():
-                self._workers[worker_name].suspend()
+            if self.is_suspended():
+                return
+            worker = self._workers[worker_name]
+        worker.suspend()
 
     def resume_one(self, worker_name):
-        if self._explicitly_suspended[worker_name]:
+        with self._lock:
+            if not self._explicitly_suspended[worker_name]:
+                return
             self._explicitly_suspended[worker_name] = False
-            if not self.is_suspended():
-                self._workers[worker_name].resume()
+            if self.is_suspended():
+                return
+            worker = self._workers[worker_name]
+        worker.resume()
 
     def suspend(self):
-        if self._count == 0:
-            since_start("Pausing background threads")
-            for n, w in self._workers.items():
-                if not self._explicitly_suspended[n]:
-                    w.suspend()
-            since_start("Background threads suspended")
-        self._count += 1
+        with self._lock:
+            self._count += 1
+            if self._count > 1:
+                return
+            workers = self._not_explicitly_suspended()
+        since_start("Pausing background threads")
+        for w in workers:
+            w.suspend()
+        since_start("Background threads suspended")
 
     def resume(self):
-        if self._count > 0:
-            self._count -= 1
+        with self._lock:
             if self._count == 0:
-                since_start("Resuming background threads")
-                for n, w in self._workers.items():
-                    if not self._explicitly_suspended[n]:
-                        w.resume()
+                return
+            self._count -= 1
+            if self._count > 0:
+                return
+            workers = self._not_explicitly_suspended()
+        since_start("Resuming background threads")
+        for w in workers:
+            w.resume()
+
+    def _not_explicitly_suspended(self):
+        return [
+            w for n, w in self._workers.items() if not self._explicitly_suspended[n]
+        ]
 
     def register(self, worker_name, worker):
-        assert worker_name not in self._workers
-        self._workers[worker_name] = worker
-        self._explicitly_suspended[worker_name] = False
+        with self._lock:
+            assert worker_name not in self._workers
+            self._workers[worker_name] = worker
+            self._explicitly_suspended[worker_name] = False
 
     def unregister(self, worker_name):
-        if worker_name in self._workers:
-            del self._workers[worker_name]
-            del self._explicitly_suspended[worker_name]
+        with self._lock:
+            if worker_name in self._workers:
+                del self._workers[worker_name]
+                del self._explicitly_suspended[worker_name]
 
 
 background_workers = _BackgroundWorkers()
@@ -531,6 +556,9 @@ class SnapshotPv(PV):
 
         :return: txt with replaced macros.
         """
+        # Called for every PV name of a file, most of which have no macros.
+        if "$(" not in txt:
+            return txt
         for key in macros:
             macro = f"$({key})"
             txt = txt.replace(macro, macros[key])
@@ -9,6 +9,7 @@ import enum
 import os
 import re
 
+import numpy
 from PyQt5 import QtCore
 from PyQt5.QtCore import (
     QItemSelection,
@@ -25,6 +26,7 @@ from PyQt5.QtWidgets import (
     QComboBox,
     QFileDialog,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QMenu,
     QMessageBox,
@@ -37,7 +39,11 @@ from PyQt5.QtWidgets import (
 
 from snapshot.ca_core import Snapshot
 from snapshot.core import PvUpdater, SnapshotPv, process_record
-from snapshot.gui.utils import make_separator, show_snapshot_parse_errors
+from snapshot.gui.utils import (
+    FilterInputTimer,
+    make_separator,
+    show_snapshot_parse_errors,
+)
 from snapshot.parser import parse_from_save_file, save_file_suffix
 
 
@@ -115,9 +121,11 @@ class SnapshotCompareWidget(QWidget):
         self.pv_filter_sel.setSizePolicy(policy)
 
         self.pv_filter_sel.currentIndexChanged.connect(self._predefined_filter_selected)
-        self.pv_filter_inp.textChanged.connect(self._create_name_filter)
-        self.pv_filter_inp.textChanged.connect(
-            lambda: self.model.change_tolerance(tol.value())
+        self._name_filter_timer = FilterInputTimer(
+            lambda: self._create_name_filter(self.pv_filter_inp.text()), self
+        )
+        self._name_filter_timer.watch(
+            self.pv_filter_inp, self.pv_filter_inp.textChanged
         )
 
         self._populate_filter_list()
@@ -136,9 +144,6 @@ class SnapshotCompareWidget(QWidget):
         # #### Regex selector
         self.regex = QCheckBox("Regex", self)
         self.regex.stateChanged.connect(self._handle_regex_change)
-        self.regex.stateChanged.connect(
-            lambda: self.model.change_tolerance(tol.value())
-        )
 
         # #### Selector for comparison filter
         compare_layout = QHBoxLayout()
@@ -152,9 +157,6 @@ class SnapshotCompareWidget(QWidget):
         self.compare_filter_inp.addItems(["Show all", "Different only", "Equal only"])
 
         self.compare_filter_inp.currentIndexChanged.connect(self._proxy.set_eq_filter)
-        self.compare_filter_inp.currentIndexChanged.connect(
-            lambda: self.model.change_tolerance(tol.value())
-        )
         self.compare_filter_inp.setMaximumWidth(200)
         compare_layout.addWidget(self.compare_filter_inp)
 
@@ -169,9 +171,6 @@ class SnapshotCompareWidget(QWidget):
         self.connected_filter_inp.currentIndexChanged.connect(
             self._proxy.set_view_filter
         )
-        self.connected_filter_inp.currentIndexChanged.connect(
-            lambda: self.model.change_tolerance(tol.value())
-        )
 
         self.connected_filter_inp.setMaximumWidth(200)
         compare_layout.addWidget(self.connected_filter_inp)
@@ -297,6 +296,12 @@ class SnapshotCompareWidget(QWidget):
     def filter_update(self):
         self._proxy.apply_filter()
 
+    def apply_pending_filter(self):
+        self._name_filter_timer.flush()
+
+    def get_filtered_pvs(self):
+        return self._proxy.get_filtered_pvs()
+
     def set_pv_update_time(self, new_pv_update_time):
         self.model.set_pv_update_time(new_pv_update_time)
 
@@ -331,6 +336,9 @@ class SnapshotPvTableView(QTableView):
         self.sortByColumn(PvTableColumns.name, Qt.AscendingOrder)  # default sorting
         self.verticalHeader().setVisible(False)
         self.verticalHeader().setDefaultSectionSize(20)
+        # All rows have the same height, so the view never needs to measure
+        # them.
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.horizontalHeader().setHighlightSections(False)
         self.horizontalHeader().setDefaultAlignment(QtCore.Qt.AlignLeft)
         self.horizontalHeader().setDefaultSectionSize(200)
@@ -381,11 +389,11 @@ class SnapshotPvTableView(QTableView):
         self._apply_selection_to_full_row()
 
     def _apply_selection_to_full_row(self):
-        rows = []
+        rows = set()
         selection = QItemSelection()
         for idx in self.selectedIndexes():
             if idx.row() not in rows:
-                rows.append(idx.row())
+                rows.add(idx.row())
                 selection.append(QItemSelectionRange(idx))
 
         self.selectionModel().select(
@@ -593,8 +601,8 @@ class SnapshotPvTableView(QTableView):
 
 # Wrap PvUpdater into QObject for threadsafe signalling
 class ModelUpdater(QtCore.QObject, PvUpdater):
-    update_complete = QtCore.pyqtSignal(list)
-    _internal_update = QtCore.pyqtSignal(list)
+    update_complete = QtCore.pyqtSignal(object)
+    _internal_update = QtCore.pyqtSignal(object)
 
     def __init__(self, parent):
         super().__init__(parent=parent, callback=self._callback)
@@ -622,13 +630,21 @@ class SnapshotPvTableModel(QtCore.QAbstractTableModel):
     """
 
     file_parse_errors = QtCore.pyqtSignal(list)
+    # Connection callbacks of all lines come from the CA thread through this
+    # signal, so the lines themselves don't need to be QObjects.
+    _pv_conn_changed = QtCore.pyqtSignal(object, bool)
 
     def __init__(self, snapshot: Snapshot, parent=None):
         super().__init__(parent)
         self.snapshot = snapshot
         self._data = []
+        self._rows = {}  # {pvname: row}
         self._file_names = []
         self._tolerance_f = 1
+        # Contents of the shown files, {file path: (modif time, pvs, errors)}.
+        # Changing the selection re-adds all selected files, most of which
+        # were already shown.
+        self._parsed_files = {}
 
         self._headers = [""] * PvTableColumns.snapshots
         self._headers[PvTableColumns.name] = "PV"
@@ -639,6 +655,15 @@ class SnapshotPvTableModel(QtCore.QAbstractTableModel):
         self._updater = ModelUpdater(self)
         self._updater.update_complete.connect(self._handle_pv_update)
 
+        # Connection changes arrive one PV at a time. Collect them and notify
+        # the view once per interval instead of once per PV.
+        self._conn_changed_lines = set()
+        self._conn_changed_timer = QtCore.QTimer(self)
+        self._conn_changed_timer.setSingleShot(True)
+        self._conn_changed_timer.setInterval(50)
+        self._conn_changed_timer.timeout.connect(self._emit_conn_changed)
+        self._pv_conn_changed.connect(self._handle_pv_conn_changed)
+
         # Tie starting and stopping the worker thread to starting and
         # stopping of the application.
         app = QtCore.QCoreApplication.instance()
@@ -669,9 +694,11 @@ class SnapshotPvTableModel(QtCore.QAbstractTableModel):
         """
         self._updater.set_pvs(pvs)
         self.beginResetModel()
+        self._conn_changed_lines.clear()
         for line in self._data:
             line.disconnect_callbacks()
         self._data = [SnapshotPvTableLine(pv, self._tolerance_f, self) for pv in pvs]
+        self._rows = {line.pvname: row for row, line in enumerate(self._data)}
         self.endResetModel()
 
     def add_snap_files(self, files: dict):
@@ -708,6 +735,11 @@ class SnapshotPvTableModel(QtCore.QAbstractTableModel):
                 pv_data = pvs_list_full_names.get(pvname, {"value": None})
                 pv_line.append_snap_value(pv_data.get("value", None))
         self.endInsertColumns()
+        # Only keep the files that are shown.
+        self._parsed_files = {
+            file_data["file_path"]: self._parsed_files[file_data["file_path"]]
+            for file_data in files.values()
+        }
         if errors:
             self.file_parse_errors.emit(errors)
 
@@ -727,7 +759,13 @@ class SnapshotPvTableModel(QtCore.QAbstractTableModel):
 
     def _replace_macros_on_file_data(self, file_data):
         macros = self.snapshot.macros or file_data["meta_data"].get("macros", dict())
-        pvs_list, _, errors = parse_from_save_file(file_data["file_path"])
+        file_path = file_data["file_path"]
+        cached = self._parsed_files.get(file_path)
+        if cached is not None and cached[0] == file_data["modif_time"]:
+            _, pvs_list, errors = cached
+        else:
+            pvs_list, _, errors = parse_from_save_file(file_path)
+            self._parsed_files[file_path] = (file_data["modif_time"], pvs_list, errors)
         # PVS data mapped to real pvs names (no macros)
         pvs_list_full_names = {
             SnapshotPv.macros_substitution(pv_name_raw, macros): pv_data
@@ -751,31 +789,60 @@ class SnapshotPvTableModel(QtCore.QAbstractTableModel):
                 else self._data[index.row()].eff_tol_tooltip
             )
         elif role == QtCore.Qt.DisplayRole:
-            return self._data[index.row()].data[index.column()].get("data", "")
+            return self._data[index.row()].display_data(index.column())
         elif role == QtCore.Qt.DecorationRole:
             return self._data[index.row()].data[index.column()].get("icon", None)
 
     def _handle_pv_update(self, new_values):
-        for value, line in zip(new_values, self._data):
+        # Only notify about the rows that changed. Each notified row is
+        # filtered again by the proxy, and most values don't change between
+        # two updates.
+        first = None
+        for row, (value, line) in enumerate(zip(new_values, self._data)):
             # PvUpdater may reconnect faster, so if we are not connected yet,
             # ignore the update.
-            if line.conn:
-                line.update_pv_value(value)
-
-        self._emit_data_changed()
-
-    def _emit_data_changed(self):
+            if line.conn and line.update_pv_value(value):
+                if first is None:
+                    first = row
+                last = row
+            elif first is not None:
+                self._emit_data_changed(first, last)
+                first = None
+
+        if first is not None:
+            self._emit_data_changed(first, last)
+
+    def _emit_data_changed(self, first=0, last=None):
         # No need to update PV names, units
         self.dataChanged.emit(
-            self.createIndex(0, PvTableColumns.value),
-            self.createIndex(len(self._data), self.columnCount() - 1),
+            self.createIndex(first, PvTableColumns.value),
+            self.createIndex(
+                len(self._data) if last is None else last, self.columnCount() - 1
+            ),
         )
 
+    def _handle_pv_conn_changed(self, line_model, conn):
+        line_model._handle_conn_callback(conn)
+        self.handle_pv_connection_status(line_model)
+
     def handle_pv_connection_status(self, line_model):
-        row = self._data.index(line_model)
-        last_column = len(line_model.data) - 1
+        self._conn_changed_lines.add(line_model)
+        if not self._conn_changed_timer.isActive():
+            self._conn_changed_timer.start()
+
+    def _emit_conn_changed(self):
+        rows = [
+            self._rows[line.pvname]
+            for line in self._conn_changed_lines
+            if line.pvname in self._rows
+        ]
+        self._conn_changed_lines.clear()
+        if not rows:
+            return
+
         self.dataChanged.emit(
-            self.createIndex(row, 0), self.createIndex(row, last_column)
+            self.createIndex(min(rows), 0),
+            self.createIndex(max(rows), self.columnCount() - 1),
         )
 
     def headerData(self, section, orientation, role):
@@ -797,23 +864,39 @@ class SnapshotPvTableModel(QtCore.QAbstractTableModel):
         self._emit_data_changed()
 
 
-class SnapshotPvTableLine(QtCore.QObject):
+class SnapshotPvTableLine:
     """
     Model of row in the PV table. Uses SnapshotPv callbacks to update its
     visualization of the PV state. The value is updated by the parent (i.e.
     SnapshotPvTableModel).
     """
 
-    connectionStatusChanged = QtCore.pyqtSignal("PyQt_PyObject")
-    _pv_conn_changed = QtCore.pyqtSignal(dict)
+    # One line exists per PV, so keep them small.
+    __slots__ = (
+        "_model",
+        "_tolerance_f",
+        "_pv_ref",
+        "pvname",
+        "_string_enum",
+        "_is_array",
+        "_precision",
+        "_precision_loaded",
+        "_config_loaded",
+        "_snap_enums_loaded",
+        "_shown_value",
+        "_shown_fmt",
+        "_snaps_eq",
+        "data",
+        "conn",
+        "_conn_clb_id",
+    )
+
     _DIR_PATH = os.path.dirname(os.path.realpath(__file__))
     _WARN_ICON = None
     _NEQ_ICON = None
     _EQ_ICON = None
 
-    def __init__(self, pv_ref, tolerance_f, parent=None):
-        super().__init__(parent)
-
+    def __init__(self, pv_ref, tolerance_f, model):
         if SnapshotPvTableLine._WARN_ICON is None:
             SnapshotPvTableLine._WARN_ICON = QIcon(
                 os.path.join(self._DIR_PATH, "images/warn.png")
@@ -825,6 +908,7 @@ class SnapshotPvTableLine(QtCore.QObject):
                 os.path.join(self._DIR_PATH, "images/eq.png")
             )
 
+        self._model = model
         self._tolerance_f = tolerance_f
         self._pv_ref = pv_ref
         self.pvname = pv_ref.pvname
@@ -837,6 +921,13 @@ class SnapshotPvTableLine(QtCore.QObject):
         self._precision = None
         self._precision_loaded = False
         self._config_loaded = False
+        self._snap_enums_loaded = False
+
+        # Last value shown and what its string depends on, see
+        # update_pv_value().
+        self._shown_value = None
+        self._shown_fmt = None
+        self._snaps_eq = None  # see are_snap_values_eq()
 
         self.data = [None] * PvTableColumns.snapshots
         self.data[PvTableColumns.name] = {"data": pv_ref.pvname}
@@ -850,12 +941,8 @@ class SnapshotPvTableLine(QtCore.QObject):
             "icon": self._WARN_ICON,
         }
 
-        self.connectionStatusChanged.connect(parent.handle_pv_connection_status)
         self._conn_clb_id = pv_ref.add_conn_callback(self._conn_callback)
 
-        # Internal signal
-        self._pv_conn_changed.connect(self._handle_conn_callback)
-
         if pv_ref.connected:
             self.conn = pv_ref.connected
             self.data[PvTableColumns.value]["data"] = ""
@@ -914,40 +1001,58 @@ class SnapshotPvTableLine(QtCore.QObject):
             # precision and string representation is not available
             if self.precision is None:
                 self._precision = 6
-            sval = SnapshotPvTableLine.string_repr_snap_value(value, self.precision)
-            self.data.append({"data": sval, "raw_value": value})
-        else:
-            self.data.append({"data": "", "raw_value": None})
+
+        # The string representation is only built once the cell is shown,
+        # see display_data().
+        self.data.append({"raw_value": value})
 
         # Do compare
         self._compare()
 
     def change_snap_value(self, column_idx, value):
-        if value is not None:
-            sval = SnapshotPvTableLine.string_repr_snap_value(value, self.precision)
-            self.data[column_idx]["data"] = sval
-        else:
-            self.data[column_idx]["data"] = ""
+        self.data[column_idx].pop("data", None)
         self.data[column_idx]["raw_value"] = value
         # Do compare
         self._compare()
 
+    def display_data(self, column_idx):
+        cell = self.data[column_idx]
+        if "data" not in cell:
+            cell["data"] = self._snap_value_display_str(cell["raw_value"])
+        return cell["data"]
+
+    def _snap_value_display_str(self, value):
+        if value is None:
+            return ""
+
+        sval = SnapshotPvTableLine.string_repr_snap_value(value, self.precision)
+        # if enum strings available, use the value to
+        # get the desired str representation of it
+        try:
+            if 0 <= int(sval) < len(self._pv_ref.enum_strs):
+                return self._pv_ref.enum_strs[int(sval)]
+        except (TypeError, ValueError, IndexError):
+            pass
+        return sval
+
     def clear_snap_values(self):
         self.data = self.data[: PvTableColumns.snapshots]
         self._compare()
 
     def are_snap_values_eq(self):
-        n_files = self.get_snap_count()
-        if n_files >= 2:
-            first_data = self.data[PvTableColumns.snapshots]["raw_value"]
-            for data in self.data[PvTableColumns.snapshots + 1 :]:
-                if not SnapshotPv.compare(
-                    first_data,
-                    data["raw_value"],
-                    self.tolerance_from_precision(),
-                ):
-                    return False
-        return True
+        # The filter asks for this on every pass, while it only changes with
+        # the files or the tolerance. Cached until the next _compare().
+        if self._snaps_eq is None:
+            self._snaps_eq = True
+            n_files = self.get_snap_count()
+            if n_files >= 2:
+                first_data = self.data[PvTableColumns.snapshots]["raw_value"]
+                tolerance = self.tolerance_from_precision()
+                for data in self.data[PvTableColumns.snapshots + 1 :]:
+                    if not SnapshotPv.compare(first_data, data["raw_value"], tolerance):
+                        self._snaps_eq = False
+                        break
+        return self._snaps_eq
 
     def is_snap_eq_to_pv(self, idx):
         idx = PvTableColumns.snap_index(idx)
@@ -964,6 +1069,7 @@ class SnapshotPvTableLine(QtCore.QObject):
         return len(self.data[PvTableColumns.snapshots :])
 
     def _compare(self, pv_value=None, get_missing=True):
+        self._snaps_eq = None
         if pv_value is None and get_missing and self._pv_ref.connected:
             pv_value = self._pv_ref.value
 
@@ -986,15 +1092,12 @@ class SnapshotPvTableLine(QtCore.QObject):
                 else:
                     snap["icon"] = self._EQ_ICON
 
-                # if enum strings available, use the value to
-                # get the desired str representation of it
-                try:
-                    if 0 <= int(snap["data"]) < len(self._pv_ref.enum_strs):
-                        self.data[PvTableColumns.snapshots + i - 1]["data"] = (
-                            self._pv_ref.enum_strs[int(snap["data"])]
-                        )
-                except (TypeError, ValueError, IndexError):
-                    pass
+            # Cells shown before the enum strings were known need to be
+            # formatted again.
+            if not self._snap_enums_loaded and self._pv_ref.enum_strs:
+                self._snap_enums_loaded = True
+                for snap in self.data[PvTableColumns.snapshots :]:
+                    snap.pop("data", None)
 
     def tolerance_from_precision(self):
         prec = self.precision
@@ -1025,30 +1128,50 @@ class SnapshotPvTableLine(QtCore.QObject):
             if self.precision is None:
                 self._precision = self._pv_ref.precision
             self._precision_loaded = True
+            # The effective tolerance was computed without the precision.
+            if not self._string_enum:
+                self.data[PvTableColumns.effective_tol] = {
+                    "data": self.effective_tolerance
+                }
 
         if pv_value is None:
+            self._shown_fmt = None
             value_col["data"] = ""
             self._compare(None, get_missing=False)
             return True
-        new_value = SnapshotPv.value_to_display_str(pv_value, self.precision)
-        # if enum strings available, use the value to
-        # get the desired str representation of it
-        try:
-            if 0 <= int(pv_value) < len(self._pv_ref.enum_strs):
-                enum_str_value = self._pv_ref.enum_strs[int(pv_value)]
-                new_value = enum_str_value
-                self._string_enum = True
-                self.data[PvTableColumns.effective_tol] = (
-                    {"data": ""}
-                    if self._string_enum
-                    else {"data": self.effective_tolerance}
-                )
-        except (TypeError, ValueError, IndexError):
-            pass
 
         if unit_col["data"] == "UNDEF":
             unit_col["data"] = self._pv_ref.units
 
+        # Every update brings all values, most of them unchanged. Formatting
+        # them again would give the same string, so skip it.
+        fmt = (self.precision, self._pv_ref.enum_strs)
+        if fmt == self._shown_fmt and self._same_value(pv_value, self._shown_value):
+            return False
+        self._shown_fmt = fmt
+        self._shown_value = pv_value
+
+        # if enum strings available, use the value to
+        # get the desired str representation of it. Only scalars can be
+        # enums, so other PVs don't go through the failing conversion.
+        new_value = None
+        enum_strs = fmt[1]
+        if enum_strs and not isinstance(pv_value, numpy.ndarray):
+            try:
+                if 0 <= int(pv_value) < len(enum_strs):
+                    new_value = enum_strs[int(pv_value)]
+                    self._string_enum = True
+                    self.data[PvTableColumns.effective_tol] = (
+                        {"data": ""}
+                        if self._string_enum
+                        else {"data": self.effective_tolerance}
+                    )
+            except (TypeError, ValueError, IndexError):
+                pass
+
+        if new_value is None:
+            new_value = SnapshotPv.value_to_display_str(pv_value, self.precision)
+
         if value_col["data"] == new_value:
             return False
 
@@ -1057,19 +1180,28 @@ class SnapshotPvTableLine(QtCore.QObject):
 
         return True
 
-    def _conn_callback(self, **kwargs):
-        self._pv_conn_changed.emit(kwargs)
-
-    def _handle_conn_callback(self, data):
-        self.conn = data.get("conn")
+    @staticmethod
+    def _same_value(value1, value2):
+        if type(value1) is not type(value2):
+            return False
+        if isinstance(value1, numpy.ndarray):
+            return value1.dtype == value2.dtype and numpy.array_equal(value1, value2)
+        return value1 == value2
+
+    def _conn_callback(self, conn, **kwargs):
+        # Only the connection state is used, don't pass the whole kwargs
+        # dict to the GUI thread.
+        self._model._pv_conn_changed.emit(self, bool(conn))
+
+    def _handle_conn_callback(self, conn):
+        self.conn = conn
+        self._shown_fmt = None
         self.data[PvTableColumns.value] = (
             {"data": "", "icon": None}
             if self.conn
             else {"data": "PV disconnected", "icon": self._WARN_ICON}
         )
 
-        self.connectionStatusChanged.emit(self)
-
 
 class SnapshotPvFilterProxyModel(QSortFilterProxyModel):
     """
@@ -1085,6 +1217,14 @@ class SnapshotPvFilterProxyModel(QSortFilterProxyModel):
         self._eq_filter = PvCompareFilter.show_all
         self._filtered_pvs = set()
 
+        # The filters are resolved when they are set, so filterAcceptsRow()
+        # only does cheap calls and bool checks for each row.
+        self._name_match = None  # None when any name matches
+        self._show_eq = True
+        self._show_neq = True
+        self._show_conn = True
+        self._show_disconn = True
+
     def get_filtered_pvs(self):
         return self._filtered_pvs
 
@@ -1094,19 +1234,33 @@ class SnapshotPvFilterProxyModel(QSortFilterProxyModel):
 
     def set_name_filter(self, srch_filter):
         self._name_filter = srch_filter
+        if isinstance(srch_filter, str):
+            self._name_match = (
+                (lambda pvname: srch_filter in pvname) if srch_filter else None
+            )
+        else:
+            # regex parser
+            self._name_match = srch_filter.fullmatch
         self.apply_filter()
 
     def set_eq_filter(self, mode):
         self._eq_filter = PvCompareFilter(mode)
+        self._show_eq = self._eq_filter != PvCompareFilter.show_neq
+        self._show_neq = self._eq_filter != PvCompareFilter.show_eq
         self.apply_filter()
 
     def set_view_filter(self, mode):
         self._view_filter = PvViewFilter(mode)
+        self._show_conn = self._view_filter != PvViewFilter.show_disconn
+        self._show_disconn = self._view_filter != PvViewFilter.show_conn
         self.apply_filter()
 
     def apply_filter(self):
         # during invalidateFilter(), filterAcceptsRow() is called for each row
         self.invalidateFilter()
+        # Rows only update the set, which is shared with the receivers, so
+        # one notification per pass is enough.
+        self.filtered.emit(self._filtered_pvs)
 
     def lessThan(self, lhs: QtCore.QModelIndex, rhs: QtCore.QModelIndex) -> bool:
         try:
@@ -1124,79 +1278,26 @@ class SnapshotPvFilterProxyModel(QSortFilterProxyModel):
         """
 
         row_model = self.sourceModel().get_pv_line_model(idx)
-        result = False
-        if row_model:
-            n_files = row_model.get_snap_count()
 
-            if isinstance(self._name_filter, str):
-                name_match = self._name_filter in row_model.pvname
-            else:
-                # regex parser
-                name_match = self._name_filter.fullmatch(row_model.pvname) is not None
+        # Name and connection are cheap to check. Values are only compared
+        # for rows that are still visible and only when the comparison
+        # filter can hide them.
+        result = (
+            self._name_match is None or bool(self._name_match(row_model.pvname))
+        ) and (self._show_conn if row_model.conn else self._show_disconn)
 
+        if result and not (self._show_eq and self._show_neq):
+            n_files = row_model.get_snap_count()
             if n_files > 1:  # multi-file mode
                 files_equal = row_model.are_snap_values_eq()
-
-                compare_match = (
-                    ((self._eq_filter == PvCompareFilter.show_eq) and files_equal)
-                    or (
-                        (self._eq_filter == PvCompareFilter.show_neq)
-                        and not files_equal
-                    )
-                    or (self._eq_filter == PvCompareFilter.show_all)
-                )
-
-                result = (
-                    name_match
-                    and compare_match
-                    and (
-                        (self._view_filter == PvViewFilter.show_all)
-                        or (
-                            not row_model.conn
-                            and (self._view_filter == PvViewFilter.show_disconn)
-                        )
-                        or (
-                            row_model.conn
-                            and (self._view_filter == PvViewFilter.show_conn)
-                        )
-                    )
-                )
-
+                result = self._show_eq if files_equal else self._show_neq
             elif n_files == 1:  # "pv-compare" mode
                 compare = row_model.is_snap_eq_to_pv(0)
-                compare_match = (
-                    ((self._eq_filter == PvCompareFilter.show_eq) and compare)
-                    or ((self._eq_filter == PvCompareFilter.show_neq) and not compare)
-                    or (self._eq_filter == PvCompareFilter.show_all)
-                )
-                compare_conn = (
-                    (self._view_filter == PvViewFilter.show_all)
-                    or (
-                        not row_model.conn
-                        and (self._view_filter == PvViewFilter.show_disconn)
-                    )
-                    or (
-                        row_model.conn and (self._view_filter == PvViewFilter.show_conn)
-                    )
-                )
-                result = name_match and compare_match and compare_conn
-            else:
-                # Only name and connection filters apply
-                result = name_match and (
-                    (self._view_filter == PvViewFilter.show_all)
-                    or (
-                        not row_model.conn
-                        and (self._view_filter == PvViewFilter.show_disconn)
-                    )
-                    or (
-                        row_model.conn and (self._view_filter == PvViewFilter.show_conn)
-                    )
-                )
+                result = self._show_eq if compare else self._show_neq
 
         if result:
             self._filtered_pvs.add(row_model.pvname)
         else:
             self._filtered_pvs.discard(row_model.pvname)
 
-        self.filtered.emit(self._filtered_pvs)
         return result
@@ -12,17 +12,17 @@ import re
 import time
 
 from PyQt5 import QtCore, QtGui
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QSortFilterProxyModel, Qt
 from PyQt5.QtGui import QColor, QCursor, QGuiApplication, QPalette
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QFormLayout,
     QHBoxLayout,
     QLineEdit,
     QMenu,
     QMessageBox,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -30,6 +30,7 @@ from PyQt5.QtWidgets import (
 from snapshot.ca_core import ActionStatus, PvStatus, SnapshotPv
 from snapshot.core import BackgroundThread, background_workers, since_start
 from snapshot.parser import (
+    SaveFileHeaderCache,
     get_save_files,
     list_save_files,
     parse_from_save_file,
@@ -38,6 +39,7 @@ from snapshot.parser import (
 
 from .utils import (
     DetailedMsgBox,
+    FilterInputTimer,
     SnapshotEditMetadataDialog,
     SnapshotKeywordSelectorWidget,
     show_snapshot_parse_errors,
@@ -141,7 +143,7 @@ class SnapshotRestoreWidget(QWidget):
 
     files_selected = QtCore.pyqtSignal(dict)
     files_updated = QtCore.pyqtSignal()
-    restored_callback = QtCore.pyqtSignal(dict, bool)
+    restored_callback = QtCore.pyqtSignal(object, bool)
 
     def __init__(self, snapshot, common_settings, parent=None, **kw):
         QWidget.__init__(self, parent, **kw)
@@ -149,9 +151,6 @@ class SnapshotRestoreWidget(QWidget):
         self.snapshot = snapshot
         self.common_settings = common_settings.copy()
         self.filtered_pvs = []
-        # dict of available files to avoid multiple openings of one file when
-        # not needed.
-        self.file_list = {}
 
         # Create main layout
         layout = QVBoxLayout(self)
@@ -170,6 +169,7 @@ class SnapshotRestoreWidget(QWidget):
         self.refresh_button.clicked.connect(self.start_refresh)
         self.refresh_button.setToolTip("Refresh .snap files.")
         self.refresh_button.setEnabled(True)
+        self._refresh_needed = False
 
         self.restore_button = QPushButton("Restore Filtered", self)
         self.restore_button.clicked.connect(self.start_restore_filtered)
@@ -256,9 +256,13 @@ class SnapshotRestoreWidget(QWidget):
         self.restore_button.setVisible(True)
 
     def indicate_refresh_needed(self):
-        self.refresh_button.setStyleSheet("background-color: red;")
+        # The scanner keeps reporting the change until the list is refreshed.
+        if not self._refresh_needed:
+            self._refresh_needed = True
+            self.refresh_button.setStyleSheet("background-color: red;")
 
     def start_refresh(self):
+        self._refresh_needed = False
         self.refresh_button.setStyleSheet("")
         self.rebuild_file_list()
 
@@ -282,6 +286,8 @@ class SnapshotRestoreWidget(QWidget):
             # Do not start a restore if nothing to restore
 
     def do_restore(self, pvs_list=None):
+        # The selected file must be one that passes the current filter.
+        self.file_selector.filter_input.apply_pending_filter()
         num_pvs = len(pvs_list) if pvs_list else "ALL"
         response = QMessageBox.question(
             self,
@@ -306,6 +312,8 @@ class SnapshotRestoreWidget(QWidget):
                 macros = self.snapshot.macros
 
                 if pvs_list is not None:
+                    # The selection from the compare view comes as a list.
+                    pvs_list = set(pvs_list)
                     for pvname in pvs_in_file.keys():
                         if (
                             SnapshotPv.macros_substitution(pvname, macros)
@@ -428,9 +436,6 @@ class SnapshotRestoreWidget(QWidget):
         # status of the restore action.
         error = False
         msgs = []
-        msg_times = []
-        status_txt = ""
-        status_background = ""
         for pvname, sts in status.items():
             if sts == PvStatus.access_err:
                 error = (
@@ -440,31 +445,28 @@ class SnapshotRestoreWidget(QWidget):
                     f"WARNING: {pvname}: Not restored (no connection or no write access)."
                 )
 
-                msg_times.append(time.time())
-                status_txt = "Restore error"
-                status_background = "#F06464"
-
             elif sts == PvStatus.type_err:
                 error = True
                 msgs.append(f"WARNING: {pvname}: Not restored (type problem).")
-                msg_times.append(time.time())
-                status_txt = "Restore error"
-                status_background = "#F06464"
 
-        self.sts_log.log_msgs(msgs, msg_times)
+        # The messages are all about the same finished restore, so they share
+        # one time stamp.
+        self.sts_log.log_msgs(msgs, time.time())
 
         if not error:
             self.sts_log.log_msgs("Restore finished.", time.time())
             status_txt = "Restore done"
             status_background = "#64C864"
+        else:
+            status_txt = "Restore error"
+            status_background = "#F06464"
 
         # Enable button when restore is finished
         if not self.common_settings["no_restore_all"]:
             self.restore_all_button.setEnabled(True)
         self.restore_button.setEnabled(True)
 
-        if status_txt:
-            self.sts_info.set_status(status_txt, 3000, status_background)
+        self.sts_info.set_status(status_txt, 3000, status_background)
 
     def handle_selected_files(self, selected_files):
         """
@@ -515,6 +517,10 @@ class SnapshotRestoreFileSelector(QWidget):
 
         self.file_list = {}
         self.pvs = {}
+        # {file name: (row key, column strings)}, reused across rebuilds
+        self._file_rows = {}
+        # Headers of unchanged save files are not parsed again on rebuild.
+        self.header_cache = SaveFileHeaderCache()
 
         # Filter handling
         self.file_filter = {"keys": [], "comment": ""}
@@ -523,26 +529,34 @@ class SnapshotRestoreFileSelector(QWidget):
         self.filter_input.file_filter_updated.connect(self.filter_file_list_selector)
 
         # Create list with: file names, comment, labels, machine params.
-        # This is done with a single-level QTreeWidget instead of QTableWidget
+        # This is done with a single-level QTreeView instead of QTableView
         # because it is line-oriented whereas a table is cell-oriented.
-        self.file_selector = QTreeWidget(self)
+        # Filtering is done by the proxy model, so hiding files does not touch
+        # the rows one by one.
+        self.column_labels = ["File name", "Comment", "Labels"]
+        self.model = SnapshotFileListModel(self.column_labels, self)
+        self._proxy = SnapshotFileFilterProxyModel(self)
+        self._proxy.setSourceModel(self.model)
+
+        self.file_selector = QTreeView(self)
         self.file_selector.setRootIsDecorated(False)
         self.file_selector.setUniformRowHeights(True)
+        self.file_selector.setItemsExpandable(False)
         self.file_selector.setIndentation(0)
-        self.file_selector.setColumnCount(FileSelectorColumns.params)
-        self.column_labels = ["File name", "Comment", "Labels"]
-        self.file_selector.setHeaderLabels(self.column_labels)
         self.file_selector.setAllColumnsShowFocus(True)
+        self.file_selector.setModel(self._proxy)
         self.file_selector.setSortingEnabled(True)
         # Sort by file name (alphabetical order)
-        self.file_selector.sortItems(FileSelectorColumns.filename, Qt.DescendingOrder)
+        self.file_selector.sortByColumn(
+            FileSelectorColumns.filename, Qt.DescendingOrder
+        )
 
-        self.file_selector.itemSelectionChanged.connect(self.select_files)
+        self.file_selector.selectionModel().selectionChanged.connect(self.select_files)
         self.file_selector.setContextMenuPolicy(Qt.CustomContextMenu)
         self.file_selector.customContextMenuRequested.connect(self.open_menu)
 
         self.file_selector.setStyleSheet(
-            "QTreeWidget::item:selected{" "background:rgba(1,154,207,255)}"
+            "QTreeView::item:selected{" "background:rgba(1,154,207,255)}"
         )
 
         # Set column sizes
@@ -555,7 +569,7 @@ class SnapshotRestoreFileSelector(QWidget):
         #   Ctrl + click     adds current file to selected files
         #   Shift + click    adds all files between last selected and current
         #                    to selected
-        self.file_selector.setSelectionMode(QTreeWidget.ExtendedSelection)
+        self.file_selector.setSelectionMode(QAbstractItemView.ExtendedSelection)
 
         self.filter_file_list_selector()
 
@@ -573,13 +587,14 @@ class SnapshotRestoreFileSelector(QWidget):
     def rebuild_file_list(self, already_parsed_files=None):
         background_workers.suspend()
         self.clear_file_selector()
-        self.file_selector.setSortingEnabled(False)
         if already_parsed_files:
             save_files, err_to_report = already_parsed_files
         else:
             save_dir = self.common_settings["save_dir"]
             req_file_path = self.common_settings["req_file_path"]
-            save_files, err_to_report = get_save_files(save_dir, req_file_path)
+            save_files, err_to_report = get_save_files(
+                save_dir, req_file_path, self.header_cache
+            )
 
         self._update_file_list_selector(save_files)
         self.filter_file_list_selector()
@@ -588,7 +603,6 @@ class SnapshotRestoreFileSelector(QWidget):
         if err_to_report:
             show_snapshot_parse_errors(self, err_to_report)
 
-        self.file_selector.setSortingEnabled(True)
         self.files_updated.emit(save_files)
         background_workers.resume()
 
@@ -604,30 +618,44 @@ class SnapshotRestoreFileSelector(QWidget):
             new_labels.update(labels)
             new_params.update(params.keys())
 
-        new_labels = list(new_labels)
         new_params = list(new_params)
         defined_params = list(self.common_settings["machine_params"].keys())
-        all_params = defined_params + [p for p in new_params if p not in defined_params]
+        all_params = defined_params + [
+            p for p in new_params if p not in self.common_settings["machine_params"]
+        ]
+        params_key = tuple(all_params)
+        param_columns = {p: idx for idx, p in enumerate(all_params)}
+        files = []
+        file_rows = {}
         for new_file, new_data in file_list.items():
             meta_data = new_data["meta_data"]
             labels = meta_data.get("labels", [])
-            params = meta_data.get("machine_params", {})
             comment = meta_data.get("comment", "")
 
-            row = [new_file, comment, " ".join(labels)]
-            assert len(row) == FileSelectorColumns.params
-            param_vals = [None] * len(all_params)
-            for p, v in params.items():
-                string = SnapshotPv.value_to_display_str(
-                    v["value"],
-                    v["precision"] if v["precision"] is not None else 0,
-                )
-                idx = all_params.index(p)
-                param_vals[idx] = string
-            selector_item = QTreeWidgetItem(row + param_vals)
-            self.file_selector.addTopLevelItem(selector_item)
+            # Unless the file was modified or the machine param columns
+            # changed, it shows the same as before and its old row is reused.
+            row_key = (new_data["modif_time"], comment, tuple(labels), params_key)
+            cached = self._file_rows.get(new_file)
+            if cached and cached[0] == row_key:
+                row = cached[1]
+            else:
+                params = meta_data.get("machine_params", {})
+                row = [new_file, comment, " ".join(labels)]
+                assert len(row) == FileSelectorColumns.params
+                param_vals = [None] * len(all_params)
+                for p, v in params.items():
+                    string = SnapshotPv.value_to_display_str(
+                        v["value"],
+                        v["precision"] if v["precision"] is not None else 0,
+                    )
+                    param_vals[param_columns[p]] = string
+                row += param_vals
+
+            file_rows[new_file] = (row_key, row)
+            files.append((new_file, new_data, row))
             self.file_list[new_file] = new_data
-            self.file_list[new_file]["file_selector"] = selector_item
+
+        self._file_rows = file_rows
 
         self.common_settings["existing_labels"] = new_labels
         self.common_settings["existing_params"] = new_params
@@ -647,8 +675,7 @@ class SnapshotRestoreFileSelector(QWidget):
                     break
 
         headers = self.column_labels + all_params
-        self.file_selector.setColumnCount(len(headers))
-        self.file_selector.setHeaderLabels(headers)
+        self.model.set_files(headers, files)
         self.file_selector.resizeColumnToContents(0)
 
         # There can be some rather long comments in the snapshots, so let's
@@ -662,117 +689,7 @@ class SnapshotRestoreFileSelector(QWidget):
             )
 
     def filter_file_list_selector(self):
-        file_filter = self.filter_input.file_filter
-
-        def ensure_nums_or_strings(*vals):
-            """Variables have to be all numbers or all strings. If this is not
-            the case, convert everything to strings."""
-            if not all((isinstance(x, (int, float)) for x in vals)):
-                return tuple((str(x) for x in vals))
-            return vals
-
-        def check_params(params_filter, file_params):
-            """
-            file_params is a dict of machine params and their data (being a
-            dict containing 'value' and 'precision').
-            params_filter is a dict of machine params and corresponding lists.
-            These lists have either one or two elements, causing either an
-            equality or in-range check.
-
-            Returns True if all checks pass.
-            """
-            for p, vals in params_filter.items():
-                if p not in file_params:
-                    return False
-                if len(vals) == 1:
-                    v1 = vals[0]
-                    v2 = file_params[p]["value"]
-                    v1, v2 = ensure_nums_or_strings(v1, v2)
-                    if isinstance(v2, float):
-                        # If precision is defined, compare with tolerance.
-                        # The default precision is 6, which matches string
-                        # formatting behaviour. It makes no sense to do
-                        # comparison to a higher precision than what the user
-                        # can see.
-                        prec = file_params[p]["precision"]
-                        tol = 10 ** (-prec) if (prec and prec > 0) else 10**-6
-                        if abs(v1 - v2) > tol:
-                            return False
-                    elif v1 != v2:
-                        return False
-
-                elif len(vals) == 2:
-                    vals = ensure_nums_or_strings(*vals)
-                    low = min(vals)
-                    high = max(vals)
-                    v = file_params[p]["value"]
-                    v, low, high = ensure_nums_or_strings(v, low, high)
-                    if v < low or v > high:
-                        return False
-            return True
-
-        for file_name in self.file_list:
-            file_line = self.file_list[file_name]["file_selector"]
-            file_to_filter = self.file_list.get(file_name)
-
-            if not file_filter:
-                file_line.setHidden(False)
-            else:
-                keys_filter = file_filter.get("keys")
-                comment_filter = file_filter.get("comment")
-                name_filter = file_filter.get("name")
-                params_filter = file_filter.get("params")
-
-                if keys_filter:
-                    keys_status = False
-                    if len(keys_filter) == 1:
-                        for key in file_to_filter["meta_data"]["labels"]:
-                            # Break when first found
-                            if key and (key in keys_filter):
-                                keys_status = True
-                                break
-                    # identical length
-                    elif len(keys_filter) == len(
-                        file_to_filter["meta_data"]["labels"]
-                    ) and set(keys_filter) == set(
-                        file_to_filter["meta_data"]["labels"]
-                    ):
-                        keys_status = True
-                    else:  # verify if the file keys contain all the filter keys
-                        not_good = True
-                        for key in keys_filter:
-                            if key not in file_to_filter["meta_data"]["labels"]:
-                                not_good = False
-                        if not_good:
-                            keys_status = True
-                else:
-                    keys_status = True
-
-                if comment_filter:
-                    comment_status = (
-                        comment_filter in file_to_filter["meta_data"]["comment"]
-                    )
-                else:
-                    comment_status = True
-
-                if name_filter:
-                    name_status = name_filter in file_name
-                else:
-                    name_status = True
-
-                params_status = True
-                if params_filter:
-                    params_status = check_params(
-                        params_filter,
-                        file_to_filter["meta_data"]["machine_params"],
-                    )
-
-                # Set visibility if any of the filters conditions met
-                file_line.setHidden(
-                    not (
-                        name_status and keys_status and comment_status and params_status
-                    )
-                )
+        self._proxy.set_file_filter(self.filter_input.file_filter)
 
     def open_menu(self, point):
         item_idx = self.file_selector.indexAt(point)
@@ -814,16 +731,17 @@ class SnapshotRestoreFileSelector(QWidget):
 
     def select_files(self):
         # Pre-process selected items, to a list of files
-        self.selected_files = []
-        if self.file_selector.selectedItems():
-            self.selected_files.extend(
-                item.text(FileSelectorColumns.filename)
-                for item in self.file_selector.selectedItems()
+        self.selected_files = [
+            idx.data()
+            for idx in self.file_selector.selectionModel().selectedRows(
+                FileSelectorColumns.filename
             )
+        ]
 
         self.files_selected.emit(self.selected_files)
 
     def delete_files(self):
+        self.filter_input.apply_pending_filter()
         if not self.selected_files:
             return
         msg = "Do you want to delete selected files?"
@@ -839,8 +757,9 @@ class SnapshotRestoreFileSelector(QWidget):
             symlink_target = os.path.realpath(symlink_path)
 
             files = self.selected_files[:]
+            # Listed files already carry their full path.
             paths = [
-                os.path.join(self.common_settings["save_dir"], selected_file)
+                self.file_list[selected_file]["file_path"]
                 for selected_file in self.selected_files
             ]
 
@@ -848,19 +767,13 @@ class SnapshotRestoreFileSelector(QWidget):
                 files.append(symlink_file)
                 paths.append(symlink_path)
 
+            removed = set()
             for selected_file, file_path in zip(files, paths):
                 try:
                     os.remove(file_path)
                     self.file_list.pop(selected_file)
                     self.pvs = {}
-                    items = self.file_selector.findItems(
-                        selected_file,
-                        Qt.MatchCaseSensitive,
-                        FileSelectorColumns.filename,
-                    )
-                    self.file_selector.takeTopLevelItem(
-                        self.file_selector.indexOfTopLevelItem(items[0])
-                    )
+                    removed.add(selected_file)
 
                 except OSError as e:
                     warn = "Problem deleting file:\n" + str(e)
@@ -871,6 +784,8 @@ class SnapshotRestoreFileSelector(QWidget):
                         QMessageBox.Ok,
                         QMessageBox.NoButton,
                     )
+            self.model.remove_files(removed)
+            self.select_files()  # Model reset clears the selection silently
             self.files_updated.emit(self.file_list)
             background_workers.resume()
 
@@ -878,8 +793,12 @@ class SnapshotRestoreFileSelector(QWidget):
         if not self.selected_files:
             return
         if len(self.selected_files) == 1:
+            # The dialog edits the metadata in place. The parsed metadata is
+            # shared with the header cache, so give it a copy.
+            file_data = self.file_list.get(self.selected_files[0])
+            meta_data = copy.deepcopy(file_data["meta_data"])
             settings_window = SnapshotEditMetadataDialog(
-                self.file_list.get(self.selected_files[0])["meta_data"],
+                meta_data,
                 self.common_settings,
                 self,
             )
@@ -888,11 +807,8 @@ class SnapshotRestoreFileSelector(QWidget):
             # the list
             if settings_window.exec_():
                 background_workers.suspend()
-                file_data = self.file_list.get(self.selected_files[0])
                 try:
-                    self.snapshot.replace_metadata(
-                        file_data["file_path"], file_data["meta_data"]
-                    )
+                    self.snapshot.replace_metadata(file_data["file_path"], meta_data)
                 except OSError as e:
                     warn = "Problem modifying file:\n" + str(e)
                     QMessageBox.warning(
@@ -915,12 +831,188 @@ class SnapshotRestoreFileSelector(QWidget):
             )
 
     def clear_file_selector(self):
-        self.file_selector.clear()  # Clears and "deselects" itmes on file selector
+        self.model.clear()  # Clears and "deselects" itmes on file selector
         self.select_files()  # Process new,empty list of selected files
         self.pvs = {}
         self.file_list = {}
 
 
+class SnapshotFileListModel(QtCore.QAbstractTableModel):
+    """
+    Model of the file selector. Each row is one snapshot file; the model keeps
+    the strings shown in its columns and the file data used for filtering.
+    """
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._files = []  # [(file_name, file_data, column strings)]
+
+    def set_files(self, headers, files):
+        """
+        Replace all rows.
+
+        :param headers: list of column names
+        :param files: list of (file_name, file_data, column strings) tuples
+        :return:
+        """
+        self.beginResetModel()
+        self._headers = headers
+        self._files = files
+        self.endResetModel()
+
+    def remove_files(self, file_names):
+        # One reset instead of removing the rows one at a time, each of which
+        # would also change the selection.
+        self.beginResetModel()
+        self._files = [f for f in self._files if f[0] not in file_names]
+        self.endResetModel()
+
+    def clear(self):
+        self.set_files(self._headers[: FileSelectorColumns.params], [])
+
+    def get_file_name(self, row: int):
+        return self._files[row][0]
+
+    def get_file_data(self, row: int):
+        return self._files[row][1]
+
+    # Reimplementation of parent methods needed for visualization
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        # Flat list, rows have no children.
+        return 0 if parent.isValid() else len(self._files)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self._headers)
+
+    def data(self, index, role):
+        if role == QtCore.Qt.DisplayRole:
+            return self._files[index.row()][2][index.column()]
+
+    def headerData(self, section, orientation, role):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self._headers[section]
+
+        return super().headerData(section, orientation, role)
+
+
+class SnapshotFileFilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy model providing the file filtering functionality of the file
+    selector.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filter_active = False
+        self._keys_filter = set()
+        self._comment_filter = ""
+        self._name_filter = ""
+        self._params_filter = None
+
+    def set_file_filter(self, file_filter):
+        self._keys_filter = set(file_filter.get("keys") or ())
+        self._comment_filter = file_filter.get("comment")
+        self._name_filter = file_filter.get("name")
+        self._params_filter = file_filter.get("params")
+
+        active = any(
+            (
+                self._keys_filter,
+                self._comment_filter,
+                self._name_filter,
+                self._params_filter,
+            )
+        )
+        if not active and not self._filter_active:
+            # Empty filter and no file is hidden, nothing would change.
+            return
+        self._filter_active = active
+
+        # during invalidateFilter(), filterAcceptsRow() is called for each row
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, idx: int, source_parent: QtCore.QModelIndex):
+        """
+        Reimplemented parent method, to define the file list filtering.
+
+        :param idx: index of the file line
+        :param source_parent:
+        :return: visible (True), hidden(False)
+        """
+        if not self._filter_active:
+            return True
+
+        file_name = self.sourceModel().get_file_name(idx)
+        meta_data = self.sourceModel().get_file_data(idx)["meta_data"]
+
+        # The file must have all the filter labels
+        if not self._keys_filter.issubset(meta_data["labels"]):
+            return False
+
+        if self._comment_filter and self._comment_filter not in meta_data["comment"]:
+            return False
+
+        if self._name_filter and self._name_filter not in file_name:
+            return False
+
+        if self._params_filter and not check_params(
+            self._params_filter, meta_data["machine_params"]
+        ):
+            return False
+
+        return True
+
+
+def ensure_nums_or_strings(*vals):
+    """Variables have to be all numbers or all strings. If this is not
+    the case, convert everything to strings."""
+    if not all((isinstance(x, (int, float)) for x in vals)):
+        return tuple((str(x) for x in vals))
+    return vals
+
+
+def check_params(params_filter, file_params):
+    """
+    file_params is a dict of machine params and their data (being a
+    dict containing 'value' and 'precision').
+    params_filter is a dict of machine params and corresponding lists.
+    These lists have either one or two elements, causing either an
+    equality or in-range check.
+
+    Returns True if all checks pass.
+    """
+    for p, vals in params_filter.items():
+        if p not in file_params:
+            return False
+        if len(vals) == 1:
+            v1 = vals[0]
+            v2 = file_params[p]["value"]
+            v1, v2 = ensure_nums_or_strings(v1, v2)
+            if isinstance(v2, float):
+                # If precision is defined, compare with tolerance.
+                # The default precision is 6, which matches string
+                # formatting behaviour. It makes no sense to do
+                # comparison to a higher precision than what the user
+                # can see.
+                prec = file_params[p]["precision"]
+                tol = 10 ** (-prec) if (prec and prec > 0) else 10**-6
+                if abs(v1 - v2) > tol:
+                    return False
+            elif v1 != v2:
+                return False
+
+        elif len(vals) == 2:
+            vals = ensure_nums_or_strings(*vals)
+            low = min(vals)
+            high = max(vals)
+            v = file_params[p]["value"]
+            v, low, high = ensure_nums_or_strings(v, low, high)
+            if v < low or v > high:
+                return False
+    return True
+
+
 def num_or_string(string):
     """Decodes the string using json decoder if possible. If the result is a
     float, an int or a string, returns it directly, otherwise returns None.
@@ -1019,6 +1111,8 @@ class SnapshotFileFilterWidget(QWidget):
 
         # Init filters
         self.file_filter = {"keys": [], "comment": "", "name": ""}
+
+        self._filter_timer = FilterInputTimer(self.update_filter, self)
         # Labels filter
         self.keys_input = SnapshotKeywordSelectorWidget(
             self.common_settings, parent=self
@@ -1033,7 +1127,7 @@ class SnapshotFileFilterWidget(QWidget):
         self.param_input.setPlaceholderText("Filter by parameters")
         self.param_input.setValidator(self.validator)
         self.param_input.textEdited.connect(self.set_param_input_color)
-        self.param_input.textEdited.connect(self.update_filter)
+        self._filter_timer.watch(self.param_input, self.param_input.textEdited)
         right_layout.addRow("Params:", self.param_input)
 
         self._inp_palette_ok = self.param_input.palette()
@@ -1043,13 +1137,13 @@ class SnapshotFileFilterWidget(QWidget):
         # File name filter
         self.name_input = QLineEdit(self)
         self.name_input.setPlaceholderText("Filter by name")
-        self.name_input.textChanged.connect(self.update_filter)
+        self._filter_timer.watch(self.name_input, self.name_input.textChanged)
         left_layout.addRow("Name:", self.name_input)
 
         # Comment filter
         self.comment_input = QLineEdit(self)
         self.comment_input.setPlaceholderText("Filter by comment")
-        self.comment_input.textChanged.connect(self.update_filter)
+        self._filter_timer.watch(self.comment_input, self.comment_input.textChanged)
         left_layout.addRow("Comment:", self.comment_input)
 
     def set_param_input_color(self):
@@ -1059,12 +1153,22 @@ class SnapshotFileFilterWidget(QWidget):
             self.param_input.setPalette(self._inp_palette_err)
 
     def update_filter(self):
-        self.file_filter["keys"] = self.keys_input.get_keywords() or []
-        self.file_filter["comment"] = self.comment_input.text().strip("")
-        self.file_filter["name"] = self.name_input.text().strip("")
-        self.file_filter["params"] = self.validator.parse(self.param_input.text())
+        file_filter = {
+            # Copy, the keyword selector keeps changing its own list.
+            "keys": list(self.keys_input.get_keywords() or []),
+            "comment": self.comment_input.text().strip(""),
+            "name": self.name_input.text().strip(""),
+            "params": self.validator.parse(self.param_input.text()),
+        }
+        # E.g. a character typed and deleted again before the timer fired.
+        if file_filter == self.file_filter:
+            return
+        self.file_filter = file_filter
         self.file_filter_updated.emit()
 
+    def apply_pending_filter(self):
+        self._filter_timer.flush()
+
     def update_params(self):
         self.keys_input.update_suggested_keywords()
         defined_params = list(self.common_settings["machine_params"].keys())
@@ -1078,7 +1182,15 @@ class SnapshotFileFilterWidget(QWidget):
         )
 
     def clear(self):
+        # Each of the inputs would otherwise emit its own change and refilter
+        # the file list; do it once at the end instead.
+        inputs = (self.keys_input, self.name_input, self.comment_input)
+        for inp in inputs:
+            inp.blockSignals(True)
         self.keys_input.clear_keywords()
         self.name_input.setText("")
         self.comment_input.setText("")
+        for inp in inputs:
+            inp.blockSignals(False)
+        self._filter_timer.stop()
         self.update_filter()
@@ -4,10 +4,10 @@
 # but WITHOUT ANY WARRANTY; without even the implied warranty of
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
 
-import datetime
 import os
 import time
 
+from epics import ca
 from PyQt5 import QtCore
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
@@ -20,7 +20,7 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 from snapshot.ca_core import ActionStatus, PvStatus
-from snapshot.core import get_machine_param_data
+from snapshot.core import background_workers, get_machine_param_data
 from snapshot.gui.utils import DetailedMsgBox, SnapshotKeywordSelectorWidget
 from snapshot.parser import save_file_suffix
 
@@ -42,6 +42,8 @@ class SnapshotSaveWidget(QWidget):
     """
 
     saved = QtCore.pyqtSignal()
+    # True when a save starts, False when it is over (whatever the outcome).
+    saving = QtCore.pyqtSignal(bool)
 
     def __init__(self, snapshot, common_settings, parent=None, **kw):
         QWidget.__init__(self, parent, **kw)
@@ -49,6 +51,14 @@ class SnapshotSaveWidget(QWidget):
         self.common_settings = common_settings
         self.snapshot = snapshot
         self.file_path = None
+        self._save_args = None
+        self._save_thread = None
+        self._save_worker = None
+        # The main window doesn't close during a save, see
+        # SnapshotGui.closeEvent(). This is for any other way of quitting, a
+        # running QThread must not be destroyed.
+        app = QtCore.QCoreApplication.instance()
+        app.aboutToQuit.connect(self._wait_for_save)
 
         # Default saved file name: If req file name is PREFIX.req, then saved
         # file name is: PREFIX_YYMMDD_hhmmss (holds time info)
@@ -73,6 +83,7 @@ class SnapshotSaveWidget(QWidget):
         self.advanced = SnapshotAdvancedSaveSettings(self.common_settings, self)
 
         self.name_extension = ""
+        self._update_path_prefix()
         self.update_name()
 
         filename_layout.addWidget(file_name_label)
@@ -114,6 +125,7 @@ class SnapshotSaveWidget(QWidget):
 
     def handle_new_snapshot_instance(self, snapshot):
         self.snapshot = snapshot
+        self._update_path_prefix()
         self.update_name()
         self.update_labels()
         self.advanced.labels_input.clear_keywords()
@@ -176,76 +188,105 @@ class SnapshotSaveWidget(QWidget):
                 self.common_settings["save_dir"],
                 self.common_settings["save_file_prefix"] + "latest" + save_file_suffix,
             )
-            status, pvs_status = self.snapshot.save_pvs(
-                self.file_path,
-                force=force,
+            self._save_args = dict(
+                file_path=self.file_path,
                 labels=labels,
                 comment=comment,
                 machine_params=params_data,
                 symlink_path=output_file,
             )
+            self.saving.emit(True)
+            self._start_save_thread(force)
 
-            if status == ActionStatus.no_conn:
-                # Prompt user and ask if he wants to save in force mode
-                msg = (
-                    "Some PVs are not connected (see details). "
-                    "Do you want to save anyway?\n"
-                )
-
-                msg_window = DetailedMsgBox(
-                    msg, "\n".join(list(pvs_status.keys())), "Warning", self
-                )
-                reply = msg_window.exec_()
-
-                if reply != QMessageBox.No:
-                    # Start saving process in forced mode and notify when
-                    # finished
-                    status, pvs_status = self.snapshot.save_pvs(
-                        self.file_path,
-                        force=True,
-                        labels=labels,
-                        comment=comment,
-                        machine_params=params_data,
-                        symlink_path=output_file,
-                    )
-
-                    # finished in forced mode
-                    self.save_done(pvs_status, True, output_file)
-                else:
-                    # User rejected saving with unconnected PVs. Not an error
-                    # state.
-                    self.sts_log.log_msgs("Save rejected by user.", time.time())
-                    self.sts_info.clear_status()
-                    self.save_button.setEnabled(True)
+        else:
+            # User rejected saving into existing file.
+            # Not an error state.
+            self.sts_info.clear_status()
 
-            elif status == ActionStatus.ok:
-                # Save done in "default force mode"
-                self.save_done(pvs_status, force, output_file)
+    def _start_save_thread(self, force):
+        # Reading all PVs can take a while, keep the GUI responsive meanwhile.
+        # The result is handled in _handle_save_finished().
+        # The background workers are suspended from the GUI thread for the
+        # whole save. save_pvs() suspending and resuming them from the save
+        # thread then only changes the count.
+        background_workers.suspend()
+        self._save_worker = SaveWorker(self.snapshot, force, self._save_args)
+        self._save_thread = QtCore.QThread()
+        self._save_worker.moveToThread(self._save_thread)
+        self._save_thread.started.connect(self._save_worker.run)
+        self._save_worker.finished.connect(self._save_thread.quit)
+        self._save_worker.finished.connect(self._handle_save_finished)
+        self._save_thread.start()
+
+    def _wait_for_save(self):
+        if self._save_thread is not None:
+            self._save_thread.wait()
+
+    def _handle_save_finished(self, status, pvs_status, forced):
+        self._save_thread.wait()
+        self._save_thread = None
+        self._save_worker = None
+        background_workers.resume()
+        file_path = self._save_args["file_path"]
+        output_file = self._save_args["symlink_path"]
+        if status == ActionStatus.no_conn:
+            # Prompt user and ask if he wants to save in force mode
+            msg = (
+                "Some PVs are not connected (see details). "
+                "Do you want to save anyway?\n"
+            )
 
-            elif status == ActionStatus.os_error:
-                msg = f"Could not write to file {self.file_path}."
-                QMessageBox.warning(
-                    self, "Warning", msg, QMessageBox.Ok, QMessageBox.NoButton
-                )
+            msg_window = DetailedMsgBox(
+                msg, "\n".join(list(pvs_status.keys())), "Warning", self
+            )
+            reply = msg_window.exec_()
 
+            if reply != QMessageBox.No:
+                # Start saving process in forced mode and notify when
+                # finished
+                self._start_save_thread(True)
+                return
             else:
-                msg = f"Error occurred with code {status}."
-                QMessageBox.warning(
-                    self, "Warning", msg, QMessageBox.Ok, QMessageBox.NoButton
-                )
+                # User rejected saving with unconnected PVs. Not an error
+                # state.
+                self.sts_log.log_msgs("Save rejected by user.", time.time())
+                self.sts_info.clear_status()
+                self.save_button.setEnabled(True)
+
+        elif status == ActionStatus.ok:
+            # Save done, in "default force mode" or in forced mode
+            self.save_done(pvs_status, forced, output_file)
+
+        elif status == ActionStatus.os_error:
+            msg = f"Could not write to file {file_path}."
+            QMessageBox.warning(
+                self, "Warning", msg, QMessageBox.Ok, QMessageBox.NoButton
+            )
+            self.sts_info.clear_status()
+            self.save_button.setEnabled(True)
+
+        elif status is None:
+            msg = f"Error occurred while saving: {pvs_status}"
+            QMessageBox.warning(
+                self, "Warning", msg, QMessageBox.Ok, QMessageBox.NoButton
+            )
+            self.sts_info.clear_status()
+            self.save_button.setEnabled(True)
 
         else:
-            # User rejected saving into existing file.
-            # Not an error state.
+            msg = f"Error occurred with code {status}."
+            QMessageBox.warning(
+                self, "Warning", msg, QMessageBox.Ok, QMessageBox.NoButton
+            )
             self.sts_info.clear_status()
+            self.save_button.setEnabled(True)
+
+        self.saving.emit(False)
 
     def save_done(self, status, forced, output_file):
         # Enable save button, and update status widgets
         success = True
         msgs = []
-        msg_times = []
-        status_txt = ""
-        status_background = ""
         for pvname, sts in status.items():
             if sts != PvStatus.ok:
                 if sts == PvStatus.access_err:
@@ -257,20 +298,19 @@ class SnapshotSaveWidget(QWidget):
                 else:
                     success = False
                     msgs.append(f"WARNING: {pvname}: Not saved, error status {sts}.")
-                msg_times.append(time.time())
-                status_txt = "Save error"
-                status_background = "#F06464"
-        self.sts_log.log_msgs(msgs, msg_times)
+        # One time stamp for all warnings of this save.
+        self.sts_log.log_msgs(msgs, time.time())
 
         if success:
             self.sts_log.log_msgs("Save finished.", time.time())
             status_txt = f"Save done (output file: {output_file})"
             status_background = "#64C864"
+        else:
+            status_txt = "Save error"
+            status_background = "#F06464"
 
         self.save_button.setEnabled(True)
-
-        if status_txt:
-            self.sts_info.set_status(status_txt, 3000, status_background)
+        self.sts_info.set_status(status_txt, 3000, status_background)
 
         self.saved.emit()
 
@@ -280,27 +320,26 @@ class SnapshotSaveWidget(QWidget):
         )
         # save widget -> save layout -> label -> setText
         self.layout.itemAt(2).itemAt(1).widget().setText(self.output_dir_label_text)
+        self._update_path_prefix()
 
-    def update_name(self):
-        name_extension_rb = "{TIMESTAMP}" + save_file_suffix
-        self.name_extension = datetime.datetime.fromtimestamp(time.time()).strftime(
-            "%Y%m%d_%H%M%S"
-        )
-
+    def _update_path_prefix(self):
+        # Everything except the timestamp only changes with the request file
+        # or the output directory, so it is joined once here and not on every
+        # update_name() call.
         self.common_settings["save_file_prefix"] = (
             os.path.split(self.common_settings["req_file_path"])[1].split(".")[0] + "_"
         )
-
-        self.file_path = os.path.join(
-            self.common_settings["save_dir"],
-            self.common_settings["save_file_prefix"]
-            + self.name_extension
-            + save_file_suffix,
+        self._path_prefix = os.path.join(
+            self.common_settings["save_dir"], self.common_settings["save_file_prefix"]
         )
         self.file_name_rb.setText(
-            self.common_settings["save_file_prefix"] + name_extension_rb
+            self.common_settings["save_file_prefix"] + "{TIMESTAMP}" + save_file_suffix
         )
 
+    def update_name(self):
+        self.name_extension = time.strftime("%Y%m%d_%H%M%S")
+        self.file_path = self._path_prefix + self.name_extension + save_file_suffix
+
     def check_file_name_available(self):
         # If file exists, user must decide whether to overwrite it or not
         if os.path.exists(self.file_path):
@@ -317,6 +356,37 @@ class SnapshotSaveWidget(QWidget):
         self.advanced.update_labels()
 
 
+class SaveWorker(QtCore.QObject):
+    """
+    Calls Snapshot.save_pvs() when its thread is started. The result is
+    emitted as (action_status, pvs_status, forced). If saving raised an
+    exception, action_status is None and pvs_status is the exception.
+    """
+
+    finished = QtCore.pyqtSignal(object, object, bool)
+
+    def __init__(self, snapshot, force, save_args):
+        super().__init__()
+        self.snapshot = snapshot
+        self.force = force
+        self.save_args = dict(save_args)
+        self.file_path = self.save_args.pop("file_path")
+
+    def run(self):
+        status = None
+        pvs_status = None
+        try:
+            # Same CA context as the rest of the application.
+            ca.use_initial_context()
+            status, pvs_status = self.snapshot.save_pvs(
+                self.file_path, force=self.force, **self.save_args
+            )
+        except Exception as e:
+            pvs_status = e
+        finally:
+            self.finished.emit(status, pvs_status, self.force)
+
+
 class SnapshotAdvancedSaveSettings(QWidget):
     def __init__(self, common_settings, parent=None):
         super().__init__(parent)
@@ -107,18 +107,18 @@ class SnapshotGui(QMainWindow):
         menu_bar = self.menuBar()
 
         file_menu = QMenu("File", menu_bar)
-        open_new_req_file_action = QAction("Open", file_menu)
-        open_new_req_file_action.setMenuRole(QAction.NoRole)
-        open_new_req_file_action.triggered.connect(self.open_new_req_file)
-        file_menu.addAction(open_new_req_file_action)
-
-        save_menu_action = QAction("Set output directory", file_menu)
-        save_menu_action.setMenuRole(QAction.NoRole)
-        save_menu_action.triggered.connect(self.save_new_output_dir)
+        self.open_new_req_file_action = QAction("Open", file_menu)
+        self.open_new_req_file_action.setMenuRole(QAction.NoRole)
+        self.open_new_req_file_action.triggered.connect(self.open_new_req_file)
+        file_menu.addAction(self.open_new_req_file_action)
+
+        self.save_menu_action = QAction("Set output directory", file_menu)
+        self.save_menu_action.setMenuRole(QAction.NoRole)
+        self.save_menu_action.triggered.connect(self.save_new_output_dir)
         # read-only mode
         if self.common_settings["read_only"]:
-            save_menu_action.setDisabled(True)
-        file_menu.addAction(save_menu_action)
+            self.save_menu_action.setDisabled(True)
+        file_menu.addAction(self.save_menu_action)
 
         quit_action = QAction("Quit", file_menu)
         quit_action.setMenuRole(QAction.NoRole)
@@ -157,8 +157,19 @@ class SnapshotGui(QMainWindow):
         self.restore_widget.files_updated.connect(self.handle_files_updated)
 
         self.restore_widget.files_selected.connect(self.handle_selected_files)
+        # The compare widget only reports the filtered PVs when the filter is
+        # applied again, so hand over the current set now.
+        self.handle_pvs_filtered(self.compare_widget.get_filtered_pvs())
+        # "Restore Filtered" must not restore the PVs of a filter that is
+        # still being typed.
+        self.restore_widget.restore_button.pressed.connect(
+            self.compare_widget.apply_pending_filter
+        )
 
         self.save_widget.saved.connect(self.restore_widget.rebuild_file_list)
+        self._saving = False
+        self._close_after_save = False
+        self.save_widget.saving.connect(self.handle_saving)
 
         self.autorefresh = QCheckBox("Periodic PV update")
         self.autorefresh.setChecked(True)
@@ -264,24 +275,35 @@ class SnapshotGui(QMainWindow):
 
         self.set_request_file(req_file_path, macros)
         save_dir = self.common_settings["save_dir"]
+        header_cache = self.restore_widget.file_selector.header_cache
 
         # Read snapshots and instantiate PVs in parallel
         def getfiles(*args):
             return get_save_files(*args)
 
+        # init_snapshot() must run inside the block; leaving it waits for the
+        # files to be parsed. The parsing only uses the paths passed here, so
+        # init_snapshot() may change common_settings or show dialogs
+        # meanwhile. The header cache is safe to share with this thread.
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_files = executor.submit(getfiles, save_dir, req_file_path)
-        self.init_snapshot(req_file_path, macros)
-        if self.common_settings["save_dir"] == save_dir:
+            future_files = executor.submit(
+                getfiles, save_dir, req_file_path, header_cache
+            )
+            self.init_snapshot(req_file_path, macros)
+        new_paths = (
+            self.common_settings["save_dir"],
+            self.common_settings["req_file_path"],
+        )
+        if new_paths == (save_dir, req_file_path):
             already_parsed_files = future_files.result()
         else:
             # Apparently init_snapshot() found that the request file was
-            # invalid, the save_dir changed, and we need to junk the
-            # already read snapfiles.
-            future_files.cancel()
+            # invalid, another one or another save_dir was chosen, and we
+            # need to junk the already read snapfiles.
             already_parsed_files = get_save_files(
                 self.common_settings["save_dir"],
                 self.common_settings["req_file_path"],
+                header_cache,
             )
 
         # handle all gui components
@@ -362,7 +384,7 @@ class SnapshotGui(QMainWindow):
         )
 
         # Metadata to be filled from snapshot files.
-        self.common_settings["existing_labels"] = []
+        self.common_settings["existing_labels"] = set()
         self.common_settings["existing_params"] = []
 
     def handle_files_updated(self):
@@ -375,7 +397,34 @@ class SnapshotGui(QMainWindow):
         self.compare_widget.new_selected_files(selected_files)
 
     def _handle_restore_request(self, pvs_list):
-        self.restore_widget.do_restore(pvs_list)
+        # The restore widget is disabled while a save is running.
+        if self.restore_widget.isEnabled():
+            self.restore_widget.do_restore(pvs_list)
+
+    def handle_saving(self, saving):
+        # The save runs in a thread. Until it is done, don't let the user
+        # restore, change files in the save directory or replace the
+        # snapshot that is being saved.
+        self.restore_widget.setEnabled(not saving)
+        self.open_new_req_file_action.setEnabled(not saving)
+        self.save_menu_action.setEnabled(
+            not saving and not self.common_settings["read_only"]
+        )
+        self._saving = saving
+        if not saving and self._close_after_save:
+            self.close()
+
+    def closeEvent(self, event):
+        if self._saving:
+            # Closing now would abandon the save half way. Close once it is
+            # done, the GUI stays responsive meanwhile.
+            self._close_after_save = True
+            self.status_bar.set_status(
+                "Waiting for the save to finish ...", 0, "orange"
+            )
+            event.ignore()
+        else:
+            event.accept()
 
     def handle_pvs_filtered(self, pv_names_set):
         # Yes, this merely sets the reference to the set of names, so
@@ -388,10 +437,15 @@ class SnapshotGui(QMainWindow):
 class SnapshotStatusLog(QWidget):
     """Command line like logger widget"""
 
+    # Oldest lines are dropped once the log is longer than this. It is big
+    # enough to hold the per-PV warnings of a large save or restore.
+    max_lines = 10000
+
     def __init__(self, parent=None):
         QWidget.__init__(self, parent)
         self.sts_log = QPlainTextEdit(self)
         self.sts_log.setReadOnly(True)
+        self.sts_log.setMaximumBlockCount(self.max_lines)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(10, 10, 10, 10)
@@ -401,18 +455,23 @@ class SnapshotStatusLog(QWidget):
     def log_msgs(self, msgs, msg_times):
         if not isinstance(msgs, list):
             msgs = [msgs]
+        elif not msgs:
+            return
 
         if not isinstance(msg_times, list):
-            msg_times = [msg_times] * len(msgs)
-
-        msg_times = (
-            datetime.datetime.fromtimestamp(t).strftime("%H:%M:%S.%f")
-            for t in msg_times
-        )
-        self.sts_log.insertPlainText(
-            "\n".join("[{}] {}".format(*t) for t in zip(msg_times, msgs)) + "\n"
+            # All messages share the time, format it only once.
+            msg_times = [
+                datetime.datetime.fromtimestamp(msg_times).strftime("%H:%M:%S.%f")
+            ] * len(msgs)
+        else:
+            msg_times = (
+                datetime.datetime.fromtimestamp(t).strftime("%H:%M:%S.%f")
+                for t in msg_times
+            )
+        # Appending keeps the view at the bottom if it already was there.
+        self.sts_log.appendPlainText(
+            "\n".join("[{}] {}".format(*t) for t in zip(msg_times, msgs))
         )
-        self.sts_log.ensureCursorVisible()
 
 
 class SnapshotStatus(QStatusBar):
@@ -425,6 +484,7 @@ class SnapshotStatus(QStatusBar):
         self.status_txt = QLabel()
         self.status_txt.setStyleSheet("background-color: transparent")
         self.addWidget(self.status_txt)
+        self._style = None
         self.set_status()
         self.read_only_text = ""
 
@@ -438,8 +498,12 @@ class SnapshotStatus(QStatusBar):
         if self.common_settings["force"]:
             text = f"[force mode] {text}"
         self.status_txt.setText(text)
+        # Setting a style sheet repolishes the status bar, skip it if the
+        # background stays the same.
         style = f"background-color : {background}"
-        self.setStyleSheet(style)
+        if style != self._style:
+            self._style = style
+            self.setStyleSheet(style)
 
         # Force GUI updates to show status
         QtCore.QCoreApplication.processEvents()
@@ -232,6 +232,7 @@ class SnapshotKeywordSelectorWidget(QComboBox):
         # data holders
         self.selectedKeywords = []
         self.keywordWidgets = {}
+        self._suggested_keywords = None  # as currently in the drop down menu
 
         # Main layout
         # [selected widgets][input][drop down arrow (part of QComboBox)]
@@ -345,19 +346,26 @@ class SnapshotKeywordSelectorWidget(QComboBox):
     def update_suggested_keywords(self):
         # Method to be called when global list of existing labels (keywords)
         # is changed and widget must be updated.
-        self.clear()
-        labels = self.common_settings["default_labels"][:]
+        labels = set(self.common_settings["default_labels"])
+        if not self.defaults_only:
+            labels.update(self.common_settings["existing_labels"])
+        labels = sorted(labels)
+
         if not self.defaults_only:
-            labels += [
-                label
-                for label in self.common_settings["existing_labels"]
-                if label not in labels
-            ]
-            self.addItem("")
+            first_item = ""
         else:
-            self.addItem("Select labels ...")
+            first_item = "Select labels ..."
+
+        # Labels are updated on every rescan of the save files, but they
+        # rarely change. Only the first item, which add_to_selected() may
+        # have changed, needs to be set then.
+        if labels == self._suggested_keywords:
+            self.setItemText(0, first_item)
+            return
+        self._suggested_keywords = labels
 
-        labels.sort()
+        self.clear()
+        self.addItem(first_item)
         self.addItems(labels)
 
         # resize the qcombobox dropdown to show more items
@@ -410,9 +418,17 @@ class SnapshotKeywordWidget(QFrame):
     """
 
     delete = QtCore.pyqtSignal(str)
+    _REMOVE_ICON = None
 
     def __init__(self, text=None, parent=None):
         QFrame.__init__(self, parent)
+
+        if SnapshotKeywordWidget._REMOVE_ICON is None:
+            icon_path = os.path.dirname(os.path.realpath(__file__))
+            SnapshotKeywordWidget._REMOVE_ICON = QIcon(
+                os.path.join(icon_path, "images/remove.png")
+            )
+
         self.layout = QHBoxLayout()
         self.layout.setContentsMargins(3, 0, 0, 0)
         self.layout.setSpacing(0)
@@ -423,9 +439,7 @@ class SnapshotKeywordWidget(QFrame):
 
         label = QLabel(text, self)
         delete_button = QToolButton(self)
-        icon_path = os.path.dirname(os.path.realpath(__file__))
-        icon_path = os.path.join(icon_path, "images/remove.png")
-        delete_button.setIcon(QIcon(icon_path))
+        delete_button.setIcon(self._REMOVE_ICON)
         delete_button.setStyleSheet(
             "border: 0px; background-color: transparent; margin: 0px"
         )
@@ -568,3 +582,29 @@ def make_separator(parent, direction="vertical"):
     sep = QFrame(parent)
     sep.setFrameShape(QFrame.VLine if direction == "vertical" else QFrame.HLine)
     return sep
+
+
+class FilterInputTimer(QtCore.QTimer):
+    """
+    Applies a filter typed into a text input once typing pauses. Each filter
+    pass goes through all rows, so it doesn't run on every keystroke. Until
+    the timer fires, the filtered rows are those of the previous filter, so
+    flush() must be called before acting on them. Leaving the input flushes
+    as well.
+    """
+
+    def __init__(self, apply_filter, parent=None):
+        super().__init__(parent)
+        self.setSingleShot(True)
+        self.setInterval(150)
+        self._apply_filter = apply_filter
+        self.timeout.connect(apply_filter)
+
+    def watch(self, line_edit, text_signal):
+        text_signal.connect(lambda: self.start())
+        line_edit.editingFinished.connect(self.flush)
+
+    def flush(self):
+        if self.isActive():
+            self.stop()
+            self._apply_filter()
@@ -1,11 +1,11 @@
 import concurrent.futures
-import glob
 import json
 import logging
 import os
 import time
 from itertools import chain
 from pathlib import Path
+from threading import Lock
 
 import numpy
 
@@ -101,7 +101,7 @@ def initialize_config(
     config["save_file_prefix"] = ""
     config["req_file_path"] = ""
     config["req_file_macros"] = {}
-    config["existing_labels"] = []  # labels that are already in snap files
+    config["existing_labels"] = set()  # labels that are already in snap files
     config["force"] = force
     config["init_path"] = init_path or ""
 
@@ -155,6 +155,23 @@ def initialize_config(
     return config
 
 
+# Decoding the short value of a single PV is dominated by the per-call
+# overhead of json.loads(), raw_decode() skips most of it.
+_json_decoder = json.JSONDecoder()
+
+
+def _decode_json(txt):
+    try:
+        value, end = _json_decoder.raw_decode(txt)
+        if end == len(txt):
+            return value
+    except json.JSONDecodeError:
+        pass
+    # Surrounding whitespace, trailing data or invalid JSON. json.loads()
+    # accepts or rejects these the same way as before.
+    return json.loads(txt)
+
+
 def parse_from_save_file(save_file_path, metadata_only=False):
     """
     Parses save file to dict {'pvname': {'data': {'value': <value>, 'raw_name': <name_with_macros>}}}
@@ -205,16 +222,29 @@ def parse_from_save_file(save_file_path, metadata_only=False):
                     pv_value = None
                 elif split_line[1].startswith("{"):
                     # The new JSON value format
-                    data = json.loads(split_line[1])
+                    data = _decode_json(split_line[1])
                     pv_value = data["val"]
                     # EGU and PREC are ignored, only stored for information.
                 else:
                     # The legacy "name,value" format
                     pv_value_str = split_line[1]
-                    pv_value = json.loads(pv_value_str)
+                    pv_value = _decode_json(pv_value_str)
 
                 if isinstance(pv_value, list):
-                    if any(isinstance(x, list) for x in pv_value):
+                    # arrays as numpy array, because pyepics returns
+                    # as numpy array. Converting first lets numpy find
+                    # nested lists instead of checking each element here.
+                    try:
+                        array_value = numpy.asarray(pv_value)
+                    except ValueError:
+                        array_value = None
+
+                    if (
+                        array_value is None
+                        or array_value.ndim != 1
+                        or array_value.dtype == object
+                        and any(isinstance(x, list) for x in pv_value)
+                    ):
                         # A version of this tool incorrectly wrote
                         # one-element arrays, and we shouldn't crash if we
                         # read such a snapshot.
@@ -225,9 +255,7 @@ def parse_from_save_file(save_file_path, metadata_only=False):
                             "are supported."
                         )
                     else:
-                        # arrays as numpy array, because pyepics returns
-                        # as numpy array
-                        pv_value = numpy.asarray(pv_value)
+                        pv_value = array_value
 
             except json.JSONDecodeError:
                 pv_value = None
@@ -277,16 +305,19 @@ def parse_to_save_file(pvs, save_file_path, macros=None, symlink_path=None, **kw
             kw["macros"] = macros
         save_file.write("#" + json.dumps(kw) + "\n")
 
+        # Each PV is written as soon as its line is encoded, so only one
+        # encoded value is held in memory at a time.
         for pvname, data in pvs.items():
-            save_file.write(data.get("raw_name"))
+            raw_name = data.get("raw_name")
             value = data.get("val")
             if value is not None:
-                save_file.write(",")
                 if isinstance(value, numpy.ndarray):
                     data["val"] = value.tolist()
                 del data["raw_name"]  # do not duplicate
-                json.dump(data, save_file)
-            save_file.write("\n")
+                # json.dumps() uses the C encoder, json.dump() does not.
+                save_file.write(f"{raw_name},{json.dumps(data)}\n")
+            else:
+                save_file.write(f"{raw_name}\n")
 
     # Create symlink _latest.snap
     if symlink_path:
@@ -310,34 +341,112 @@ def parse_to_save_file(pvs, save_file_path, macros=None, symlink_path=None, **kw
             counter -= 1
 
 
+def _list_save_file_stats(save_dir, req_file_name):
+    """Returns a list of (path, stat result) of the save files."""
+
+    file_prefix = os.path.splitext(req_file_name)[0]
+    save_files = []
+
+    # scandir() returns the file type together with the name, so only one
+    # stat() per save file is needed.
+    try:
+        entries = os.scandir(save_dir)
+    except OSError:
+        # Missing or unreadable directory, same as no save files.
+        return save_files
+
+    with entries:
+        for entry in entries:
+            if not (
+                entry.name.startswith(file_prefix)
+                and entry.name.endswith(save_file_suffix)
+            ):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                # Removed or not accessible since it was listed, skip it.
+                continue
+            save_files.append((entry.path, stat))
+
+    return save_files
+
+
 def list_save_files(save_dir, req_file_path):
     """Returns a list of save files and a list of their modification times."""
 
     req_file_name = os.path.basename(req_file_path)
-    file_dir = os.path.join(save_dir, os.path.splitext(req_file_name)[0])
-    file_paths = [
-        path
-        for path in glob.glob(f"{file_dir}*{save_file_suffix}")
-        if os.path.isfile(path)
-    ]
-
-    modif_times = [os.path.getmtime(path) for path in file_paths]
+    save_files = _list_save_file_stats(save_dir, req_file_name)
+    file_paths = [path for path, _ in save_files]
+    modif_times = [stat.st_mtime for _, stat in save_files]
     return req_file_name, file_paths, modif_times
 
 
-def get_save_files(save_dir, req_file_path):
+class SaveFileHeaderCache:
+    """
+    Headers of save files parsed by get_save_files(). A file is read again
+    only when its modification time or size changed since the last scan.
+    Can be shared between threads. The cached metadata is also handed out to
+    the callers of get_save_files(), who must not modify it.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        # {file path: ((mtime in ns, size), meta_data, err)}
+        self._headers = {}
+
+    def get(self, file_path, stat_key):
+        with self._lock:
+            cached = self._headers.get(file_path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1], cached[2]
+        return None
+
+    def replace(self, headers):
+        # The whole result of a scan replaces the previous one, which also
+        # forgets files that are gone or belong to another request file.
+        with self._lock:
+            self._headers = headers
+
+
+def get_save_files(save_dir, req_file_path, header_cache=None):
     """
     Parses all new or modified files. Parsed files are returned as a
-    dictionary.
+    dictionary. With a header_cache, files that did not change since its
+    last scan are not parsed again.
     """
     since_start("Started parsing snaps")
-    req_file_name, file_paths, modif_times = list_save_files(save_dir, req_file_path)
+    req_file_name = os.path.basename(req_file_path)
+    save_files = _list_save_file_stats(save_dir, req_file_name)
+    file_prefix = req_file_name.split(".")[0] + "_"
 
-    def process_file(file_path, modif_time):
+    def process_file(save_file):
+        file_path, stat = save_file
         file_name = os.path.basename(file_path)
-        if os.path.isfile(file_path):
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        cached = None
+        if header_cache is not None:
+            cached = header_cache.get(file_path, stat_key)
+        if cached is not None:
+            meta_data, err = cached
+        else:
             _, meta_data, err = parse_from_save_file(file_path, metadata_only=True)
+            if meta_data:
+                # we really should have basic meta data
+                # (or filters and some other stuff will silently fail)
+                if "comment" not in meta_data:
+                    meta_data["comment"] = ""
+                if "labels" not in meta_data:
+                    meta_data["labels"] = []
+                if "machine_params" not in meta_data:
+                    meta_data["machine_params"] = {}
+        header = (stat_key, meta_data, err) if meta_data else None
 
+        # The listing already checked the file type. Only check again when
+        # the file could not be read, it may have been removed since.
+        if meta_data or os.path.isfile(file_path):
             # Check if we have req_file metadata. This is used to determine
             # which request file the save file belongs to. If there is no
             # metadata (or no req_file specified in the metadata) we search
@@ -347,38 +456,38 @@ def get_save_files(save_dir, req_file_path):
                 "req_file_name" in meta_data
                 and meta_data["req_file_name"] == req_file_name
             )
-            prefix_matches = file_name.startswith(req_file_name.split(".")[0] + "_")
+            prefix_matches = file_name.startswith(file_prefix)
             if have_metadata or prefix_matches:
-                # we really should have basic meta data
-                # (or filters and some other stuff will silently fail)
-                if "comment" not in meta_data:
-                    meta_data["comment"] = ""
-                if "labels" not in meta_data:
-                    meta_data["labels"] = []
-                if "machine_params" not in meta_data:
-                    meta_data["machine_params"] = {}
-
+                if not meta_data:
+                    meta_data = {"comment": "", "labels": [], "machine_params": {}}
                 return (
+                    header,
                     file_name,
                     {
                         "file_name": file_name,
                         "file_path": file_path,
                         "meta_data": meta_data,
-                        "modif_time": modif_time,
+                        "modif_time": stat.st_mtime,
                     },
                     err,
                 )
+        return header, None, None, None
 
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        results = executor.map(process_file, file_paths, modif_times)
+        results = executor.map(process_file, save_files)
+
+    headers = {}
     err_to_report = []
     parsed_save_files = {}
-    for r in results:
-        if r is not None:
-            file_name, info, err = r
+    for (file_path, _), (header, file_name, info, err) in zip(save_files, results):
+        if header is not None:
+            headers[file_path] = header
+        if file_name is not None:
             parsed_save_files[file_name] = info
             if err:
                 err_to_report.append((file_name, err))
+    if header_cache is not None:
+        header_cache.replace(headers)
 
     since_start("Finished parsing snaps")
     return parsed_save_files, err_to_report
@@ -11,6 +11,9 @@ from snapshot.request_files.snapshot_file import ReqParseError, SnapshotFile
 
 
 class SnapshotReqFile(SnapshotFile):
+    # Checked against every PV name, so compile it once.
+    macro_rgx = re.compile(r"\$\(.*?\)")  # find all of type $()
+
     def __init__(
         self,
         path: str,
@@ -261,8 +264,7 @@ class SnapshotReqFile(SnapshotFile):
 
     def _validate_macros_in_txt(self, txt: str):
         invalid_macros = []
-        macro_rgx = re.compile(r"\$\(.*?\)")  # find all of type $()
-        raw_macros = macro_rgx.findall(txt)
+        raw_macros = self.macro_rgx.findall(txt)
         for raw_macro in raw_macros:
             if (
                 raw_macro not in self._macros.values()
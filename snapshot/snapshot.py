@@ -3,9 +3,6 @@ import re
 import signal
 import sys
 
-import epics.ca
-import epics.utils
-
 signal.signal(signal.SIGINT, signal.SIG_DFL)
 
 
@@ -79,14 +76,6 @@ def gui(args):
 def main():
     """Main creates Qt application and handles arguments"""
 
-    # A workaround for inconsistent string encodings, needed because PSI does
-    # not enforce a particular encoding. With this setting, pyepics will
-    # backslash-escape all non-latin1 characters read from CA and reencode them
-    # back to whatever they were when writing to CA. This also allows
-    # transparent (de)serialization of arbitrary encodings. Display is broken,
-    # of course, because you can't display a string with undefined encoding.
-    epics.utils.EPICS_STR_ENCODING = "raw_unicode_escape"
-
     args_pars = argparse.ArgumentParser(
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -268,6 +257,20 @@ Can be used as graphical interface tool or a command line tool."""
 
     args = args_pars.parse_args()
 
+    # Converting request files doesn't use CA, so it doesn't need to wait for
+    # pyepics (and numpy) to load.
+    if args.func is not convert:
+        import epics.utils
+
+        # A workaround for inconsistent string encodings, needed because PSI
+        # does not enforce a particular encoding. With this setting, pyepics
+        # will backslash-escape all non-latin1 characters read from CA and
+        # reencode them back to whatever they were when writing to CA. This
+        # also allows transparent (de)serialization of arbitrary encodings.
+        # Display is broken, of course, because you can't display a string
+        # with undefined encoding.
+        epics.utils.EPICS_STR_ENCODING = "raw_unicode_escape"
+
     args.func(args)
 
 
@@ -1,10 +1,13 @@
 import logging
 import json
+import os
 
+import numpy
 import pytest
 import yaml
 
 from snapshot.create_snapshot_file import create_snapshot_file
+from snapshot.parser import list_save_files, parse_from_save_file, parse_to_save_file
 from tests.pytest.helper_functions import base_dir
 
 logging.basicConfig(level=logging.DEBUG)
@@ -59,3 +62,177 @@ def test_yaml_load():
 
     assert pvs_from_file == pvs
     assert default_metadata == metadata
+
+
+def test_list_save_files(tmp_path):
+    for name in (
+        "test.snap",
+        "test_1.snap",
+        "test_2.snap",
+        "other_1.snap",
+        "test_1.txt",
+    ):
+        (tmp_path / name).write_text("#{}\n")
+    (tmp_path / "test_dir.snap").mkdir()
+    (tmp_path / "test_dangling.snap").symlink_to(tmp_path / "missing.snap")
+    (tmp_path / "test_loop.snap").symlink_to(tmp_path / "test_loop.snap")
+
+    req_file_name, file_paths, modif_times = list_save_files(
+        str(tmp_path), "/some/dir/test.req"
+    )
+
+    assert req_file_name == "test.req"
+    assert sorted(os.path.basename(p) for p in file_paths) == [
+        "test.snap",
+        "test_1.snap",
+        "test_2.snap",
+    ]
+    assert modif_times == [os.path.getmtime(p) for p in file_paths]
+
+
+def test_list_save_files_no_dir(tmp_path):
+    assert list_save_files(str(tmp_path / "missing"), "test.req") == (
+        "test.req",
+        [],
+        [],
+    )
+
+
+def write_save_file(path, *lines):
+    path.write_text("".join(f"{line}\n" for line in ('#{"labels": []}',) + lines))
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("[1, 2, 3]", [1, 2, 3]),
+        ("[1.5, -2.5]", [1.5, -2.5]),
+        ('["a", "b"]', ["a", "b"]),
+        ("[]", []),
+    ],
+)
+def test_parse_array_value(tmp_path, value, expected):
+    save_file = write_save_file(tmp_path / "test_1.snap", f'PV:A,{{"val": {value}}}')
+
+    saved_pvs, _, err = parse_from_save_file(save_file)
+
+    assert err == []
+    pv_value = saved_pvs["PV:A"]["value"]
+    assert isinstance(pv_value, numpy.ndarray)
+    assert pv_value.ndim == 1
+    assert pv_value.tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["[[1, 2], [3, 4]]", "[[1], [2, 3]]", "[1, [2, 3]]", "[[]]", '[["a"], "b"]'],
+)
+def test_parse_nested_array_value(tmp_path, value):
+    save_file = write_save_file(tmp_path / "test_1.snap", f'PV:A,{{"val": {value}}}')
+
+    saved_pvs, _, err = parse_from_save_file(save_file)
+
+    assert saved_pvs["PV:A"]["value"] is None
+    assert err == [
+        "Value of 'PV:A' contains nested lists; only one-dimensional arrays "
+        "are supported."
+    ]
+
+
+def test_save_file_round_trip(tmp_path):
+    pvs = {
+        "PV:SCALAR": {"raw_name": "$(P):SCALAR", "val": 1.5},
+        "PV:INT": {"raw_name": "$(P):INT", "val": 7},
+        "PV:STRING": {"raw_name": "$(P):STRING", "val": 'a, "b"'},
+        "PV:ARRAY": {"raw_name": "$(P):ARRAY", "val": numpy.array([1, 2, 3])},
+        "PV:NONE": {"raw_name": "$(P):NONE", "val": None},
+    }
+    save_file = tmp_path / "test_1.snap"
+
+    parse_to_save_file(
+        pvs, str(save_file), macros={"P": "PV"}, comment="c", labels=["l"]
+    )
+
+    # Existing save files and other tools depend on the exact format.
+    assert save_file.read_text() == (
+        '#{"comment": "c", "labels": ["l"], "macros": {"P": "PV"}}\n'
+        '$(P):SCALAR,{"val": 1.5}\n'
+        '$(P):INT,{"val": 7}\n'
+        '$(P):STRING,{"val": "a, \\"b\\""}\n'
+        '$(P):ARRAY,{"val": [1, 2, 3]}\n'
+        "$(P):NONE\n"
+    )
+
+    saved_pvs, meta_data, err = parse_from_save_file(str(save_file))
+
+    assert err == []
+    assert meta_data == {"comment": "c", "labels": ["l"], "macros": {"P": "PV"}}
+    assert list(saved_pvs) == [
+        "$(P):SCALAR",
+        "$(P):INT",
+        "$(P):STRING",
+        "$(P):ARRAY",
+        "$(P):NONE",
+    ]
+    assert saved_pvs["$(P):SCALAR"]["value"] == 1.5
+    assert saved_pvs["$(P):INT"]["value"] == 7
+    assert saved_pvs["$(P):STRING"]["value"] == 'a, "b"'
+    assert saved_pvs["$(P):ARRAY"]["value"].tolist() == [1, 2, 3]
+    assert saved_pvs["$(P):NONE"]["value"] is None
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ('PV:A,{"val": 1.5}', 1.5),
+        ('PV:A,{"val": -3}', -3),
+        ('PV:A,{"val": "some, text"}', "some, text"),
+        # Enum PVs are saved with the index of their value.
+        ('PV:A,{"val": 2}', 2),
+        ('PV:A,{"val": 1.5} \t ', 1.5),
+        ('PV:A,{"val": 1.5 }', 1.5),
+        # The legacy "name,value" format
+        ("PV:A,1.5", 1.5),
+        ('PV:A,"text"', "text"),
+        ("PV:A,1.5  ", 1.5),
+        ("PV:A", None),
+    ],
+)
+def test_parse_value(tmp_path, line, expected):
+    save_file = write_save_file(tmp_path / "test_1.snap", line)
+
+    saved_pvs, _, err = parse_from_save_file(save_file)
+
+    assert err == []
+    assert saved_pvs == {"PV:A": {"value": expected}}
+
+
+def test_parse_array_value_with_spaces(tmp_path):
+    save_file = write_save_file(tmp_path / "test_1.snap", 'PV:A,{"val": [1, 2] } ')
+
+    saved_pvs, _, err = parse_from_save_file(save_file)
+
+    assert err == []
+    assert saved_pvs["PV:A"]["value"].tolist() == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        'PV:A,{"val": 1.5}x',
+        'PV:A,{"val": 1.5} {"val": 2}',
+        'PV:A,{"val": 1.5}}',
+        'PV:A,{"val": 1.5',
+        "PV:A,1.5 x",
+        "PV:A,1.5,2",
+        "PV:A,[1, 2]]",
+    ],
+)
+def test_parse_value_with_trailing_data(tmp_path, line):
+    save_file = write_save_file(tmp_path / "test_1.snap", line, "PV:B,1")
+
+    saved_pvs, _, err = parse_from_save_file(save_file)
+
+    assert saved_pvs == {"PV:A": {"value": None}, "PV:B": {"value": 1}}
+    assert err == ["Value of 'PV:A' cannot be decoded, ignored."]